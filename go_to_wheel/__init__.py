@@ -2,16 +2,19 @@
 
 import argparse
 import base64
-import csv
 import hashlib
-import io
 import os
 import shutil
 import stat
 import subprocess
 import sys
 import tempfile
+import time
 import zipfile
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from dataclasses import dataclass
 from pathlib import Path
 
 __version__ = "0.1.0"
@@ -39,6 +42,55 @@ DEFAULT_PLATFORMS = [
     "windows-arm64",
 ]
 
+# Hash algorithms supported for RECORD entries. sha256 is what pip expects;
+# blake2b (truncated to 32 bytes) is faster but only for internal pipelines.
+HASH_ALGORITHMS = ("sha256", "blake2b")
+
+# Flags passed to every go build. -trimpath and -buildvcs=false keep local
+# paths and VCS stamps out of the binary, making it smaller and the build
+# reproducible.
+GO_BUILD_FLAGS = ["-trimpath", "-buildvcs=false"]
+
+# Environment variable naming a directory for the compiled binary cache
+BINARY_CACHE_ENV = "GO_TO_WHEEL_CACHE"
+
+# Go settings that change the compiled binary, read with `go env` for the
+# binary cache key. Names a toolchain does not know print as empty lines.
+CACHE_KEY_GO_ENV = [
+    "GOVERSION",
+    "GOFLAGS",
+    "GOEXPERIMENT",
+    "GO386",
+    "GOAMD64",
+    "GOARM",
+    "GOARM64",
+    "GOMIPS",
+    "GOMIPS64",
+    "GOPPC64",
+    "GORISCV64",
+    "GOWASM",
+]
+
+# Chunk size used when streaming the Go binary from disk
+COPY_CHUNK_SIZE = 1 << 20
+
+# Compression used for the text members of a wheel. "store" skips zlib
+# entirely and is meant for wheels that are only installed locally.
+COMPRESSION_TYPES = {"deflate": zipfile.ZIP_DEFLATED, "store": zipfile.ZIP_STORED}
+
+# zlib level for the small text members of a wheel. They are a few hundred
+# bytes each, so higher levels cost time without shrinking them further.
+TEXT_COMPRESSLEVEL = 1
+
+# RECORD rows are written without CSV quoting, so wheel paths must not
+# contain any of these characters
+RECORD_UNSAFE_CHARS = ',"\r\n'
+
+# Unix permissions for wheel members: rwxr-xr-x (0755) for the binary,
+# rw-r--r-- (0644) for everything else
+BINARY_MODE = stat.S_IRWXU | stat.S_IRGRP | stat.S_IXGRP | stat.S_IROTH | stat.S_IXOTH
+FILE_MODE = stat.S_IRUSR | stat.S_IWUSR | stat.S_IRGRP | stat.S_IROTH
+
 
 def normalize_package_name(name: str) -> str:
     """Normalize package name for wheel filename (PEP 427)."""
@@ -50,11 +102,43 @@ def normalize_import_name(name: str) -> str:
     return name.replace("-", "_").replace(".", "_").lower()
 
 
-def compute_file_hash(data: bytes) -> str:
-    """Compute SHA256 hash in wheel RECORD format."""
-    digest = hashlib.sha256(data).digest()
-    encoded = base64.urlsafe_b64encode(digest).rstrip(b"=").decode("ascii")
-    return f"sha256={encoded}"
+def _new_hash(hash_algorithm: str):
+    """Return a new hashlib object for a RECORD hash algorithm."""
+    if hash_algorithm == "sha256":
+        return hashlib.sha256()
+    if hash_algorithm == "blake2b":
+        return hashlib.blake2b(digest_size=32)
+    raise ValueError(f"Unsupported hash algorithm: {hash_algorithm}")
+
+
+def _encode_record_hash(digest: bytes, hash_algorithm: str = "sha256") -> str:
+    """Encode a 32-byte digest in wheel RECORD format."""
+    # Both supported algorithms produce 32-byte digests, whose base64 form
+    # always ends in exactly one "=" pad character
+    encoded = base64.urlsafe_b64encode(digest)[:-1].decode("ascii")
+    return f"{hash_algorithm}={encoded}"
+
+
+def compute_file_hash(data: bytes, hash_algorithm: str = "sha256") -> str:
+    """Compute file hash in wheel RECORD format."""
+    h = _new_hash(hash_algorithm)
+    h.update(data)
+    return _encode_record_hash(h.digest(), hash_algorithm)
+
+
+def copy_and_hash(src, dest, hash_algorithm: str = "sha256") -> tuple[str, int]:
+    """Copy one file object to another, returning its RECORD hash and size.
+
+    Hashing while copying means a large binary is read from disk only once,
+    in chunks, rather than once for RECORD and again for the zip.
+    """
+    h = _new_hash(hash_algorithm)
+    size = 0
+    for chunk in iter(lambda: src.read(COPY_CHUNK_SIZE), b""):
+        h.update(chunk)
+        dest.write(chunk)
+        size += len(chunk)
+    return _encode_record_hash(h.digest(), hash_algorithm), size
 
 
 def compile_go_binary(
@@ -64,12 +148,15 @@ def compile_go_binary(
     goarch: str,
     go_binary: str = "go",
     ldflags: str | None = None,
+    go_cache: str | None = None,
 ) -> None:
     """Cross-compile Go binary for target platform."""
     env = os.environ.copy()
     env["GOOS"] = goos
     env["GOARCH"] = goarch
     env["CGO_ENABLED"] = "0"
+    if go_cache:
+        env["GOCACHE"] = go_cache
 
     ldflags_value = "-s -w"
     if ldflags:
@@ -78,6 +165,7 @@ def compile_go_binary(
     cmd = [
         go_binary,
         "build",
+        *GO_BUILD_FLAGS,
         f"-ldflags={ldflags_value}",
         "-o",
         output_path,
@@ -98,6 +186,86 @@ def compile_go_binary(
         )
 
 
+def binary_cache_prefix(
+    go_dir: str,
+    go_binary: str = "go",
+    ldflags: str | None = None,
+    exclude: Iterable[str] = (),
+) -> str:
+    """
+    Hash everything apart from the target platform that determines the binary.
+
+    Covers every file in the module, the Go version and the CACHE_KEY_GO_ENV
+    settings, the build flags and ldflags. Hidden files and directories such
+    as .git are skipped, as are the directories in exclude, so wheels and
+    caches written inside the module do not change the key.
+    """
+    h = hashlib.blake2b(digest_size=16)
+
+    go_env = subprocess.run(
+        [go_binary, "env", *CACHE_KEY_GO_ENV],
+        cwd=go_dir,
+        capture_output=True,
+        text=True,
+    ).stdout
+    for value in (go_env, *GO_BUILD_FLAGS, ldflags or ""):
+        h.update(value.encode("utf-8") + b"\0")
+
+    excluded = {os.path.realpath(path) for path in exclude}
+    for dirpath, dirnames, filenames in os.walk(go_dir):
+        # Pruned in place so excluded trees are never walked
+        dirnames[:] = sorted(
+            d
+            for d in dirnames
+            if not d.startswith(".")
+            and os.path.realpath(os.path.join(dirpath, d)) not in excluded
+        )
+        for filename in sorted(filenames):
+            path = os.path.join(dirpath, filename)
+            if filename.startswith(".") or not os.path.isfile(path):
+                continue
+            relative = os.path.relpath(path, go_dir).replace(os.sep, "/")
+            h.update(relative.encode("utf-8") + b"\0")
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(COPY_CHUNK_SIZE), b""):
+                    h.update(chunk)
+
+    return h.hexdigest()
+
+
+def _zip_info(file_path: str, mode: int, compress_type: int) -> zipfile.ZipInfo:
+    """Create a ZipInfo with Unix permissions and compression set."""
+    info = zipfile.ZipInfo(file_path, date_time=time.localtime()[:6])
+    info.external_attr = mode << 16
+    info.compress_type = compress_type
+    return info
+
+
+@dataclass
+class FileEntry:
+    """A file to be written into a wheel, with its RECORD hash and size.
+
+    Either data holds the file content, or source_path points at a file on
+    disk that is streamed into the wheel when it is written. For streamed
+    files the hash and size are filled in during that write.
+    """
+
+    hash: str
+    size: int
+    data: bytes | None = None
+    source_path: str | None = None
+
+    @classmethod
+    def from_bytes(cls, data: bytes, hash_algorithm: str = "sha256") -> "FileEntry":
+        """Create an entry for in-memory content."""
+        return cls(compute_file_hash(data, hash_algorithm), len(data), data=data)
+
+    @classmethod
+    def from_path(cls, path: str) -> "FileEntry":
+        """Create an entry for a file on disk, hashed when it is written."""
+        return cls("", 0, source_path=path)
+
+
 def generate_init_py(version: str, binary_name: str) -> str:
     """Generate __init__.py content."""
     return f'''"""Go binary packaged as Python wheel."""
@@ -136,11 +304,15 @@ def main():
 '''
 
 
+# __main__.py is the same for every package, so it is encoded and hashed
+# once at import time
+_MAIN_PY_BYTES = b"from . import main\nmain()\n"
+_MAIN_PY_HASH = compute_file_hash(_MAIN_PY_BYTES)
+
+
 def generate_main_py() -> str:
     """Generate __main__.py content."""
-    return '''from . import main
-main()
-'''
+    return _MAIN_PY_BYTES.decode("utf-8")
 
 
 def generate_metadata(
@@ -153,8 +325,12 @@ def generate_metadata(
     license_: str | None = None,
     url: str | None = None,
     readme_content: str | None = None,
-) -> str:
-    """Generate METADATA file content."""
+) -> bytes:
+    """Generate METADATA file content, encoded as UTF-8.
+
+    The README is encoded once and joined straight onto the headers, so a
+    large README is not copied through intermediate strings.
+    """
     lines = [
         "Metadata-Version: 2.1",
         f"Name: {name}",
@@ -175,11 +351,14 @@ def generate_metadata(
 
     if readme_content:
         lines.append("Description-Content-Type: text/markdown")
+
+    parts = ["\n".join(lines).encode("utf-8"), b"\n"]
+
+    if readme_content:
         # Add blank line before body, then the README content
-        lines.append("")
-        lines.append(readme_content)
+        parts.extend([b"\n", readme_content.encode("utf-8"), b"\n"])
 
-    return "\n".join(lines) + "\n"
+    return b"".join(parts)
 
 
 def generate_wheel_metadata(platform_tag: str) -> str:
@@ -198,30 +377,55 @@ def generate_entry_points(entry_point: str, import_name: str) -> str:
 """
 
 
-def generate_record(files: dict[str, bytes]) -> str:
-    """Generate RECORD file content."""
-    output = io.StringIO()
-    writer = csv.writer(output)
+def generate_record(entries: dict[str, FileEntry], record_path: str) -> str:
+    """Generate RECORD file content from precomputed file entries.
 
-    for path, content in files.items():
-        if path.endswith("RECORD"):
-            # RECORD itself has no hash
-            writer.writerow([path, "", ""])
-        else:
-            hash_val = compute_file_hash(content)
-            writer.writerow([path, hash_val, len(content)])
+    Rows are written directly rather than through csv, so paths that would
+    need CSV quoting are rejected.
+    """
+    # RECORD itself has no hash
+    rows = [(path, entry.hash, entry.size) for path, entry in entries.items()]
+    rows.append((record_path, "", ""))
 
-    return output.getvalue()
+    lines = []
+    for path, hash_val, size in rows:
+        if any(c in path for c in RECORD_UNSAFE_CHARS):
+            raise ValueError(f"Unsupported character in wheel path: {path!r}")
+        lines.append(f"{path},{hash_val},{size}")
 
+    return "\n".join(lines) + "\n"
 
-def build_wheel(
-    binary_path: str,
-    output_dir: str,
+
+@dataclass
+class PrebuiltArtifacts:
+    """Wheel files that are the same for every target platform.
+
+    Built once by prepare_artifacts and shared by each build_wheel_cached
+    call, so only WHEEL and RECORD are generated per platform.
+    """
+
+    name: str
+    version: str
+    entry_point: str
+    hash_algorithm: str
+    init_py: FileEntry
+    init_py_windows: FileEntry
+    main_py: FileEntry
+    metadata: FileEntry
+    entry_points: FileEntry
+
+
+def _main_py_entry(hash_algorithm: str) -> FileEntry:
+    """Return the __main__.py entry, reusing the precomputed sha256 hash."""
+    if hash_algorithm == "sha256":
+        return FileEntry(_MAIN_PY_HASH, len(_MAIN_PY_BYTES), data=_MAIN_PY_BYTES)
+    return FileEntry.from_bytes(_MAIN_PY_BYTES, hash_algorithm)
+
+
+def prepare_artifacts(
     name: str,
     version: str,
-    platform_tag: str,
     entry_point: str,
-    is_windows: bool = False,
     description: str = "Go binary packaged as Python wheel",
     requires_python: str = ">=3.10",
     author: str | None = None,
@@ -229,29 +433,10 @@ def build_wheel(
     license_: str | None = None,
     url: str | None = None,
     readme_content: str | None = None,
-) -> str:
-    """Build a wheel file from a compiled binary."""
-    normalized_name = normalize_package_name(name)
+    hash_algorithm: str = "sha256",
+) -> PrebuiltArtifacts:
+    """Generate and hash the platform-independent wheel files."""
     import_name = normalize_import_name(name)
-    binary_name = entry_point + (".exe" if is_windows else "")
-
-    # Read binary
-    with open(binary_path, "rb") as f:
-        binary_content = f.read()
-
-    # Generate all files
-    files: dict[str, bytes] = {}
-
-    # Package files
-    init_content = generate_init_py(version, binary_name).encode("utf-8")
-    main_content = generate_main_py().encode("utf-8")
-
-    files[f"{import_name}/__init__.py"] = init_content
-    files[f"{import_name}/__main__.py"] = main_content
-    files[f"{import_name}/bin/{binary_name}"] = binary_content
-
-    # dist-info files
-    dist_info = f"{normalized_name}-{version}.dist-info"
 
     metadata_content = generate_metadata(
         name,
@@ -263,42 +448,225 @@ def build_wheel(
         license_=license_,
         url=url,
         readme_content=readme_content,
-    ).encode("utf-8")
+    )
 
-    wheel_content = generate_wheel_metadata(platform_tag).encode("utf-8")
+    # __init__.py differs only by the .exe suffix on Windows
+    init_content = generate_init_py(version, entry_point).encode("utf-8")
+    init_windows_content = generate_init_py(version, entry_point + ".exe").encode(
+        "utf-8"
+    )
     entry_points_content = generate_entry_points(entry_point, import_name).encode(
         "utf-8"
     )
 
-    files[f"{dist_info}/METADATA"] = metadata_content
-    files[f"{dist_info}/WHEEL"] = wheel_content
-    files[f"{dist_info}/entry_points.txt"] = entry_points_content
+    return PrebuiltArtifacts(
+        name=name,
+        version=version,
+        entry_point=entry_point,
+        hash_algorithm=hash_algorithm,
+        init_py=FileEntry.from_bytes(init_content, hash_algorithm),
+        init_py_windows=FileEntry.from_bytes(init_windows_content, hash_algorithm),
+        main_py=_main_py_entry(hash_algorithm),
+        metadata=FileEntry.from_bytes(metadata_content, hash_algorithm),
+        entry_points=FileEntry.from_bytes(entry_points_content, hash_algorithm),
+    )
+
 
-    # Generate RECORD (must be last as it includes all other files)
-    record_path = f"{dist_info}/RECORD"
-    files[record_path] = b""  # Placeholder
-    record_content = generate_record(files).encode("utf-8")
-    files[record_path] = record_content
+def build_wheel_cached(
+    binary_path: str,
+    output_dir: str,
+    prebuilt: PrebuiltArtifacts,
+    platform_tag: str,
+    is_windows: bool = False,
+    compression: str = "deflate",
+) -> str:
+    """Build a wheel file from a compiled binary and prebuilt artifacts."""
+    normalized_name = normalize_package_name(prebuilt.name)
+    import_name = normalize_import_name(prebuilt.name)
+    binary_name = prebuilt.entry_point + (".exe" if is_windows else "")
+    hash_algorithm = prebuilt.hash_algorithm
+    text_compress_type = COMPRESSION_TYPES[compression]
+
+    # Only WHEEL, the binary and RECORD vary per platform. The binary is
+    # hashed as it is streamed from disk into the wheel.
+    entries: dict[str, FileEntry] = {}
+
+    # Package files
+    entries[f"{import_name}/__init__.py"] = (
+        prebuilt.init_py_windows if is_windows else prebuilt.init_py
+    )
+    entries[f"{import_name}/__main__.py"] = prebuilt.main_py
+    entries[f"{import_name}/bin/{binary_name}"] = FileEntry.from_path(binary_path)
+
+    # dist-info files
+    dist_info = f"{normalized_name}-{prebuilt.version}.dist-info"
+
+    wheel_content = generate_wheel_metadata(platform_tag).encode("utf-8")
+
+    entries[f"{dist_info}/METADATA"] = prebuilt.metadata
+    entries[f"{dist_info}/WHEEL"] = FileEntry.from_bytes(wheel_content, hash_algorithm)
+    entries[f"{dist_info}/entry_points.txt"] = prebuilt.entry_points
 
     # Build wheel filename
-    wheel_name = f"{normalized_name}-{version}-py3-none-{platform_tag}.whl"
+    wheel_name = f"{normalized_name}-{prebuilt.version}-py3-none-{platform_tag}.whl"
     wheel_path = os.path.join(output_dir, wheel_name)
 
-    # Create wheel zip file
-    with zipfile.ZipFile(wheel_path, "w", zipfile.ZIP_DEFLATED) as whl:
-        for file_path, content in files.items():
-            # Set executable permission for binary
-            if "/bin/" in file_path:
-                info = zipfile.ZipInfo(file_path)
-                # Set Unix permissions: rwxr-xr-x (0755)
-                info.external_attr = (stat.S_IRWXU | stat.S_IRGRP | stat.S_IXGRP | stat.S_IROTH | stat.S_IXOTH) << 16
-                whl.writestr(info, content)
-            else:
-                whl.writestr(file_path, content)
+    # Create wheel zip file. The Go binary is stored uncompressed: it is
+    # already dense, so deflating it costs a lot of time for little gain.
+    # Opened outside the try so a wheel this call never created is not removed.
+    whl = zipfile.ZipFile(wheel_path, "w", zipfile.ZIP_STORED)
+    try:
+        with whl:
+            for file_path, entry in entries.items():
+                if entry.source_path is not None:
+                    # Set executable permission for binary
+                    info = _zip_info(file_path, BINARY_MODE, zipfile.ZIP_STORED)
+                    # Known up front so zipfile only writes Zip64 headers
+                    # for binaries that actually need them
+                    info.file_size = os.path.getsize(entry.source_path)
+                    with (
+                        open(entry.source_path, "rb") as src,
+                        whl.open(info, "w") as dest,
+                    ):
+                        hash_val, size = copy_and_hash(src, dest, hash_algorithm)
+                        entry.hash, entry.size = hash_val, size
+                else:
+                    info = _zip_info(file_path, FILE_MODE, text_compress_type)
+                    whl.writestr(info, entry.data, compresslevel=TEXT_COMPRESSLEVEL)
+
+            # Generate RECORD (must be last as it includes all other files)
+            record_path = f"{dist_info}/RECORD"
+            record_content = generate_record(entries, record_path).encode("utf-8")
+            info = _zip_info(record_path, FILE_MODE, text_compress_type)
+            whl.writestr(info, record_content, compresslevel=TEXT_COMPRESSLEVEL)
+    except BaseException:
+        # Never leave a wheel without a RECORD behind
+        os.remove(wheel_path)
+        raise
 
     return wheel_path
 
 
+def build_wheel(
+    binary_path: str,
+    output_dir: str,
+    name: str,
+    version: str,
+    platform_tag: str,
+    entry_point: str,
+    is_windows: bool = False,
+    description: str = "Go binary packaged as Python wheel",
+    requires_python: str = ">=3.10",
+    author: str | None = None,
+    author_email: str | None = None,
+    license_: str | None = None,
+    url: str | None = None,
+    readme_content: str | None = None,
+    hash_algorithm: str = "sha256",
+    compression: str = "deflate",
+) -> str:
+    """Build a wheel file from a compiled binary."""
+    prebuilt = prepare_artifacts(
+        name,
+        version,
+        entry_point,
+        description=description,
+        requires_python=requires_python,
+        author=author,
+        author_email=author_email,
+        license_=license_,
+        url=url,
+        readme_content=readme_content,
+        hash_algorithm=hash_algorithm,
+    )
+    return build_wheel_cached(
+        binary_path,
+        output_dir,
+        prebuilt,
+        platform_tag,
+        is_windows=is_windows,
+        compression=compression,
+    )
+
+
+@contextmanager
+def _workdir(work_dir: str | None) -> Iterator[str]:
+    """Yield work_dir, creating it if needed, or a temporary directory."""
+    if work_dir:
+        os.makedirs(work_dir, exist_ok=True)
+        yield work_dir
+    else:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            yield tmp_dir
+
+
+def _build_binary(
+    go_dir: str,
+    output_path: str,
+    goos: str,
+    goarch: str,
+    *,
+    go_binary: str = "go",
+    ldflags: str | None = None,
+    go_cache: str | None = None,
+    binary_cache: str | None = None,
+    cache_prefix: str | None = None,
+) -> None:
+    """
+    Produce the binary for one target at output_path.
+
+    If binary_cache is set, a binary previously compiled from identical
+    inputs is copied from there instead of running go build.
+    """
+    cached_path = None
+    if binary_cache and cache_prefix:
+        cached_path = os.path.join(binary_cache, f"{cache_prefix}-{goos}-{goarch}")
+        if os.path.exists(cached_path):
+            shutil.copyfile(cached_path, output_path)
+            return
+
+    compile_go_binary(
+        go_dir,
+        output_path,
+        goos,
+        goarch,
+        go_binary,
+        ldflags=ldflags,
+        go_cache=go_cache,
+    )
+
+    if cached_path:
+        # Copy under a temporary name and rename into place, so concurrent
+        # builds sharing the cache never see a partially written binary
+        fd, tmp_path = tempfile.mkstemp(dir=binary_cache, prefix=".tmp-")
+        os.close(fd)
+        try:
+            shutil.copyfile(output_path, tmp_path)
+            os.replace(tmp_path, cached_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+
+def _compile_platform(
+    platform_str: str,
+    go_dir: str,
+    work_dir: str,
+    entry_point: str,
+    **build_options,
+) -> str:
+    """Build the binary for a single platform, returning its path."""
+    goos, goarch, _ = PLATFORM_MAPPINGS[platform_str]
+    binary_ext = ".exe" if goos == "windows" else ""
+
+    # Each platform gets its own directory so concurrent builds never collide
+    os.makedirs(work_dir, exist_ok=True)
+    binary_path = os.path.join(work_dir, f"{entry_point}{binary_ext}")
+
+    _build_binary(go_dir, binary_path, goos, goarch, **build_options)
+    return binary_path
+
+
 def build_wheels(
     go_dir: str,
     *,
@@ -317,6 +685,12 @@ def build_wheels(
     readme: str | None = None,
     ldflags: str | None = None,
     set_version_var: str | None = None,
+    hash_algorithm: str = "sha256",
+    go_cache: str | None = None,
+    compression: str = "deflate",
+    work_dir: str | None = None,
+    jobs: int | None = None,
+    binary_cache: str | None = None,
 ) -> list[str]:
     """
     Build Python wheels from a Go module.
@@ -339,6 +713,27 @@ def build_wheels(
         ldflags: Additional Go linker flags (appended to default -s -w)
         set_version_var: Go variable to set to the package version via
             -X ldflag (e.g. "main.version")
+        hash_algorithm: Hash used for RECORD entries, "sha256" (default) or
+            "blake2b". pip only accepts sha256, so only use blake2b for
+            wheels consumed by tools that support it.
+        go_cache: Go build cache directory (GOCACHE) shared by every
+            platform build. Defaults to Go's own cache location. Go locks
+            its cache, so concurrent builds can safely share it.
+        compression: "deflate" (default) to compress the wheel's text files,
+            or "store" to write everything uncompressed. Store is faster but
+            only intended for wheels installed locally, not published.
+        work_dir: Directory for intermediate binaries, kept between calls.
+            Defaults to a temporary directory removed after the build. When
+            set and go_cache is not, the Go build cache also lives here, so
+            repeated builds of the same module reuse compiled packages.
+        jobs: Maximum number of platforms to compile at once (defaults to
+            the number of CPUs)
+        binary_cache: Directory caching compiled binaries, keyed on a hash
+            of the module's files (other than go-to-wheel's own output,
+            work and cache directories), Go version and settings, flags and
+            target platform.
+            Defaults to the GO_TO_WHEEL_CACHE environment variable; caching
+            is off if neither is set.
 
     Returns:
         List of paths to built wheel files
@@ -352,6 +747,15 @@ def build_wheels(
     if not (go_path / "go.mod").exists():
         raise ValueError(f"Not a Go module: {go_dir} (no go.mod file found)")
 
+    if hash_algorithm not in HASH_ALGORITHMS:
+        raise ValueError(f"Unsupported hash algorithm: {hash_algorithm}")
+
+    if compression not in COMPRESSION_TYPES:
+        raise ValueError(f"Unsupported compression: {compression}")
+
+    if jobs is not None and jobs < 1:
+        raise ValueError(f"jobs must be at least 1, got {jobs}")
+
     # Read README file if provided
     readme_content: str | None = None
     if readme:
@@ -367,9 +771,25 @@ def build_wheels(
     if entry_point is None:
         entry_point = name
 
+    # These end up in wheel paths, so check them before anything is compiled
+    checked = {"name": name, "version": version, "entry point": entry_point}
+    for label, value in checked.items():
+        if any(c in value for c in RECORD_UNSAFE_CHARS):
+            raise ValueError(f"Unsupported character in {label}: {value!r}")
+
     if platforms is None:
         platforms = DEFAULT_PLATFORMS
 
+    if work_dir:
+        work_dir = str(Path(work_dir).resolve())
+        if not go_cache:
+            go_cache = os.path.join(work_dir, "go-cache")
+
+    if go_cache:
+        # Go requires GOCACHE to be an absolute path
+        go_cache = str(Path(go_cache).resolve())
+        os.makedirs(go_cache, exist_ok=True)
+
     # Build combined ldflags: set_version_var first, then user ldflags
     # (so explicit ldflags can override set_version_var if both set the same var)
     combined_ldflags_parts: list[str] = []
@@ -383,54 +803,97 @@ def build_wheels(
     out_path = Path(output_dir)
     out_path.mkdir(parents=True, exist_ok=True)
 
-    # Build wheels
-    built_wheels: list[str] = []
+    # Report every unknown platform up front, before any compilation starts
+    invalid = [p for p in platforms if p not in PLATFORM_MAPPINGS]
+    if invalid:
+        print(f"Warning: Unknown platform(s) {', '.join(invalid)}, skipping")
+    valid_platforms = [p for p in platforms if p in PLATFORM_MAPPINGS]
 
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        for platform_str in platforms:
-            if platform_str not in PLATFORM_MAPPINGS:
-                print(f"Warning: Unknown platform {platform_str}, skipping")
-                continue
+    built_wheels: list[str] = []
+    if not valid_platforms:
+        return built_wheels
+
+    # Compiled binaries can be reused when every build input is unchanged
+    binary_cache = binary_cache or os.environ.get(BINARY_CACHE_ENV)
+    cache_prefix = None
+    if binary_cache:
+        os.makedirs(binary_cache, exist_ok=True)
+        own_dirs = [str(out_path), binary_cache, work_dir, go_cache]
+        cache_prefix = binary_cache_prefix(
+            str(go_path),
+            go_binary,
+            combined_ldflags,
+            exclude=[d for d in own_dirs if d],
+        )
 
-            goos, goarch, platform_tag = PLATFORM_MAPPINGS[platform_str]
-            is_windows = goos == "windows"
+    max_workers = min(len(valid_platforms), jobs or os.cpu_count() or 1)
 
-            # Compile binary
-            binary_ext = ".exe" if is_windows else ""
-            binary_path = os.path.join(tmp_dir, f"{entry_point}_{platform_str}{binary_ext}")
+    # Files shared by every platform are generated and hashed once
+    prebuilt = prepare_artifacts(
+        name,
+        version,
+        entry_point,
+        description=description,
+        requires_python=requires_python,
+        author=author,
+        author_email=author_email,
+        license_=license_,
+        url=url,
+        readme_content=readme_content,
+        hash_algorithm=hash_algorithm,
+    )
 
-            try:
-                compile_go_binary(
+    errors: dict[str, str] = {}
+    wheel_futures: dict[str, Future[str]] = {}
+
+    with _workdir(work_dir) as tmp_dir:
+        with (
+            ThreadPoolExecutor(max_workers=max_workers) as compile_pool,
+            ThreadPoolExecutor(max_workers=1) as zip_pool,
+        ):
+            compile_futures = {
+                compile_pool.submit(
+                    _compile_platform,
+                    platform_str,
                     str(go_path),
-                    binary_path,
-                    goos,
-                    goarch,
-                    go_binary,
+                    os.path.join(tmp_dir, platform_str),
+                    entry_point,
+                    go_binary=go_binary,
                     ldflags=combined_ldflags,
+                    go_cache=go_cache,
+                    binary_cache=binary_cache,
+                    cache_prefix=cache_prefix,
+                ): platform_str
+                for platform_str in valid_platforms
+            }
+
+            # Package each binary on the zip thread as soon as it compiles,
+            # so the compile workers move straight on to the next platform
+            for future in as_completed(compile_futures):
+                platform_str = compile_futures[future]
+                try:
+                    binary_path = future.result()
+                except RuntimeError as e:
+                    errors[platform_str] = str(e)
+                    continue
+
+                goos, _, platform_tag = PLATFORM_MAPPINGS[platform_str]
+                wheel_futures[platform_str] = zip_pool.submit(
+                    build_wheel_cached,
+                    binary_path,
+                    str(out_path),
+                    prebuilt,
+                    platform_tag,
+                    is_windows=goos == "windows",
+                    compression=compression,
                 )
-            except RuntimeError as e:
-                print(f"Warning: {e}")
-                continue
 
-            # Build wheel
-            wheel_path = build_wheel(
-                binary_path,
-                str(out_path),
-                name,
-                version,
-                platform_tag,
-                entry_point,
-                is_windows=is_windows,
-                description=description,
-                requires_python=requires_python,
-                author=author,
-                author_email=author_email,
-                license_=license_,
-                url=url,
-                readme_content=readme_content,
-            )
-
-            built_wheels.append(wheel_path)
+            # Report in platform order so output is deterministic
+            for platform_str in valid_platforms:
+                if platform_str in errors:
+                    print(f"Warning: {errors[platform_str]}")
+                else:
+                    built_wheels.append(wheel_futures[platform_str].result())
 
     return built_wheels
 
@@ -514,6 +977,41 @@ def main() -> int:
         help="Go variable to set to the package version via -X ldflag "
         "(e.g. 'main.version'). The value is taken from --version automatically.",
     )
+    parser.add_argument(
+        "--go-cache",
+        help="Go build cache directory (GOCACHE) to use for all platform builds "
+        "(defaults to Go's own cache)",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        help="Maximum number of platforms to compile in parallel "
+        "(defaults to the number of CPUs)",
+    )
+    parser.add_argument(
+        "--binary-cache",
+        help="Directory for caching compiled binaries between runs "
+        f"(defaults to ${BINARY_CACHE_ENV}, off if unset)",
+    )
+    parser.add_argument(
+        "--work-dir",
+        help="Directory for intermediate binaries and the Go build cache, "
+        "kept between runs (defaults to a temporary directory)",
+    )
+    parser.add_argument(
+        "--compression",
+        choices=list(COMPRESSION_TYPES),
+        default="deflate",
+        help="Compression for the wheel's text files (default: deflate). "
+        "Use 'store' for faster builds of wheels that are only installed locally.",
+    )
+    parser.add_argument(
+        "--hash-algorithm",
+        choices=HASH_ALGORITHMS,
+        default="sha256",
+        help="Hash algorithm for RECORD entries (default: sha256). "
+        "pip only accepts sha256.",
+    )
 
     args = parser.parse_args()
 
@@ -544,6 +1042,12 @@ def main() -> int:
             readme=args.readme,
             ldflags=args.ldflags,
             set_version_var=args.set_version_var,
+            hash_algorithm=args.hash_algorithm,
+            go_cache=args.go_cache,
+            compression=args.compression,
+            work_dir=args.work_dir,
+            jobs=args.jobs,
+            binary_cache=args.binary_cache,
         )
     except (FileNotFoundError, ValueError) as e:
         print(f"Error: {e}", file=sys.stderr)
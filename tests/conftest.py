@@ -0,0 +1,207 @@
+"""Shared fixtures and helpers for go-to-wheel tests."""
+
+import os
+import platform
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import venv
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from go_to_wheel import BINARY_CACHE_ENV, build_wheels
+
+# Path to our test Go example
+GO_EXAMPLE_DIR = (Path(__file__).parent / "go-example").resolve()
+
+# Go example that uses var version = "dev" pattern for ldflags injection
+GO_EXAMPLE_VERSION_DIR = (Path(__file__).parent / "go-example-version").resolve()
+
+# build_wheels() takes the Go directory as a string
+GO_EXAMPLE_DIR_STR = str(GO_EXAMPLE_DIR)
+GO_EXAMPLE_VERSION_DIR_STR = str(GO_EXAMPLE_VERSION_DIR)
+
+
+def get_current_platform() -> str:
+    """Get the platform string for the current system."""
+    system = platform.system().lower()
+    machine = platform.machine().lower()
+
+    # Normalize machine names
+    if machine in ("x86_64", "amd64"):
+        arch = "amd64"
+    elif machine in ("arm64", "aarch64"):
+        arch = "arm64"
+    else:
+        arch = machine
+
+    if system == "linux":
+        return f"linux-{arch}"
+    elif system == "darwin":
+        return f"darwin-{arch}"
+    elif system == "windows":
+        return f"windows-{arch}"
+    else:
+        return f"{system}-{arch}"
+
+
+def get_wheel_platform_tag(platform_str: str) -> str:
+    """Get the wheel platform tag for a platform string."""
+    mappings = {
+        "linux-amd64": "manylinux_2_17_x86_64",
+        "linux-arm64": "manylinux_2_17_aarch64",
+        "linux-amd64-musl": "musllinux_1_2_x86_64",
+        "linux-arm64-musl": "musllinux_1_2_aarch64",
+        "darwin-amd64": "macosx_10_9_x86_64",
+        "darwin-arm64": "macosx_11_0_arm64",
+        "windows-amd64": "win_amd64",
+        "windows-arm64": "win_arm64",
+    }
+    return mappings.get(platform_str, platform_str)
+
+
+def read_dist_info(
+    whl: zipfile.ZipFile, name: str, version: str, filename: str
+) -> bytes:
+    """Read the raw bytes of a file in a wheel's .dist-info directory."""
+    dist_info = f"{name.replace('-', '_')}-{version}.dist-info"
+    return whl.read(f"{dist_info}/{filename}")
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-slow",
+        action="store_true",
+        help="Also run tests that install and execute the built wheel",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "slow: skipped unless --run-slow is passed")
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--run-slow"):
+        return
+    skip_slow = pytest.mark.skip(reason="needs --run-slow")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+# The platform never changes during a session, so look it up once
+CURRENT_PLATFORM = get_current_platform()
+CURRENT_WHEEL_TAG = get_wheel_platform_tag(CURRENT_PLATFORM)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def binary_cache(tmp_path_factory):
+    """Reuse compiled binaries across every build in the test session."""
+    if "PYTEST_XDIST_WORKER" in os.environ:
+        # Each xdist worker has its own basetemp; share one cache per run
+        cache_dir = tmp_path_factory.getbasetemp().parent / "binary-cache"
+        cache_dir.mkdir(exist_ok=True)
+    else:
+        cache_dir = tmp_path_factory.mktemp("binary-cache")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv(BINARY_CACHE_ENV, str(cache_dir))
+        yield cache_dir
+
+
+@pytest.fixture
+def stub_go_build(monkeypatch):
+    """Replace go build with a placeholder binary, for packaging-only tests."""
+
+    def fake_build_binary(go_dir, output_path, goos, goarch, **kwargs):
+        Path(output_path).write_bytes(b"\x7fELF")
+
+    monkeypatch.setattr("go_to_wheel._build_binary", fake_build_binary)
+
+
+@pytest.fixture(scope="session")
+def dist_root(tmp_path_factory):
+    """Parent directory for every wheel built during the test session."""
+    return tmp_path_factory.mktemp("dist")
+
+
+@pytest.fixture
+def output_dir(dist_root, request):
+    """An empty output directory for the wheels built by a single test."""
+    # mkdtemp keeps names unique when tests in different classes share a
+    # name, or the same test runs twice in a session
+    prefix = re.sub(r"\W", "_", request.node.name)[:30] + "-"
+    return Path(tempfile.mkdtemp(prefix=prefix, dir=dist_root))
+
+
+@pytest.fixture(scope="session")
+def default_wheels(dist_root):
+    """Wheels for go-example built once per session for the current platform.
+
+    The package name is left to default to the directory basename, so this
+    also covers that default.
+    """
+    output_dir = dist_root / "default"
+    output_dir.mkdir()
+    return build_wheels(
+        GO_EXAMPLE_DIR_STR,
+        version="1.0.0",
+        output_dir=str(output_dir),
+        platforms=[CURRENT_PLATFORM],
+    )
+
+
+@pytest.fixture(scope="session")
+def default_wheel(default_wheels):
+    """Path to the shared go-example wheel. Tests must not modify it."""
+    return default_wheels[0]
+
+
+@pytest.fixture(scope="session")
+def default_wheel_bytes(default_wheel):
+    """Contents of the shared wheel, for opening with io.BytesIO."""
+    return Path(default_wheel).read_bytes()
+
+
+@pytest.fixture(scope="session")
+def installed_python(tmp_path_factory, default_wheel):
+    """Python interpreter of a venv with the shared wheel installed."""
+    venv_dir = tmp_path_factory.mktemp("venv")
+    # Created in-process; uv only needs to be run for the install
+    venv.create(venv_dir, symlinks=os.name != "nt")
+
+    if sys.platform == "win32":
+        python_path = venv_dir / "Scripts" / "python.exe"
+    else:
+        python_path = venv_dir / "bin" / "python"
+
+    subprocess.run(
+        ["uv", "pip", "install", default_wheel, "--python", str(python_path)],
+        check=True,
+    )
+    return python_path
+
+
+@pytest.fixture(scope="session")
+def unpacked_wheel(tmp_path_factory, default_wheel):
+    """The shared wheel extracted to a directory, for use on PYTHONPATH.
+
+    Extraction drops the binary's executable bit; the generated package
+    restores it on first use.
+    """
+    target = tmp_path_factory.mktemp("unpacked")
+    with zipfile.ZipFile(default_wheel) as whl:
+        whl.extractall(target)
+    return target
+
+
+@pytest.fixture(scope="session")
+def installed_script(installed_python):
+    """The go-example console script in the installed_python venv."""
+    # Scripts live next to the interpreter; which() adds .exe on Windows
+    script = shutil.which("go-example", path=str(installed_python.parent))
+    assert script is not None
+    return script
@@ -1,7 +1,11 @@
 """Tests for go-to-wheel."""
 
+import base64
+import hashlib
+import io
 import os
-import platform
+import shutil
+import struct
 import subprocess
 import sys
 import tempfile
@@ -10,226 +14,138 @@ from pathlib import Path
 
 import pytest
 
-from go_to_wheel import build_wheels
-
-# Path to our test Go example
-GO_EXAMPLE_DIR = Path(__file__).parent / "go-example"
-
-# Go example that uses var version = "dev" pattern for ldflags injection
-GO_EXAMPLE_VERSION_DIR = Path(__file__).parent / "go-example-version"
-
-
-def get_current_platform() -> str:
-    """Get the platform string for the current system."""
-    system = platform.system().lower()
-    machine = platform.machine().lower()
-
-    # Normalize machine names
-    if machine in ("x86_64", "amd64"):
-        arch = "amd64"
-    elif machine in ("arm64", "aarch64"):
-        arch = "arm64"
-    else:
-        arch = machine
-
-    if system == "linux":
-        return f"linux-{arch}"
-    elif system == "darwin":
-        return f"darwin-{arch}"
-    elif system == "windows":
-        return f"windows-{arch}"
-    else:
-        return f"{system}-{arch}"
-
-
-def get_wheel_platform_tag(platform_str: str) -> str:
-    """Get the wheel platform tag for a platform string."""
-    mappings = {
-        "linux-amd64": "manylinux_2_17_x86_64",
-        "linux-arm64": "manylinux_2_17_aarch64",
-        "linux-amd64-musl": "musllinux_1_2_x86_64",
-        "linux-arm64-musl": "musllinux_1_2_aarch64",
-        "darwin-amd64": "macosx_10_9_x86_64",
-        "darwin-arm64": "macosx_11_0_arm64",
-        "windows-amd64": "win_amd64",
-        "windows-arm64": "win_arm64",
-    }
-    return mappings.get(platform_str, platform_str)
+from go_to_wheel import (
+    BINARY_CACHE_ENV,
+    binary_cache_prefix,
+    build_wheel,
+    build_wheels,
+)
+
+from .conftest import (
+    CURRENT_PLATFORM,
+    CURRENT_WHEEL_TAG,
+    GO_EXAMPLE_DIR_STR,
+    GO_EXAMPLE_VERSION_DIR_STR,
+    read_dist_info,
+)
 
 
 class TestBuildWheels:
     """Tests for the build_wheels function."""
 
-    def test_builds_correct_number_of_wheels_single_platform(self, tmp_path):
+    def test_builds_correct_number_of_wheels_single_platform(self, default_wheels):
         """Test that building for a single platform produces one wheel."""
-        output_dir = tmp_path / "dist"
-        output_dir.mkdir()
+        assert len(default_wheels) == 1
 
-        current_platform = get_current_platform()
+    def test_builds_correct_number_of_wheels_multiple_platforms(self, output_dir):
+        """Test that building for multiple platforms produces correct number of wheels."""
+        platforms = ["linux-amd64", "linux-arm64", "darwin-amd64", "darwin-arm64"]
         wheels = build_wheels(
-            str(GO_EXAMPLE_DIR),
+            GO_EXAMPLE_DIR_STR,
             name="go-example",
             version="1.0.0",
             output_dir=str(output_dir),
-            platforms=[current_platform],
+            platforms=platforms,
         )
 
-        assert len(wheels) == 1
-        assert all(Path(w).exists() for w in wheels)
-
-    def test_builds_correct_number_of_wheels_multiple_platforms(self, tmp_path):
-        """Test that building for multiple platforms produces correct number of wheels."""
-        output_dir = tmp_path / "dist"
-        output_dir.mkdir()
+        assert len(wheels) == 4
+        assert sorted(os.listdir(output_dir)) == sorted(Path(w).name for w in wheels)
 
-        platforms = ["linux-amd64", "linux-arm64", "darwin-amd64", "darwin-arm64"]
+    @pytest.mark.usefixtures("stub_go_build")
+    def test_builds_multiple_platforms_one_job_at_a_time(self, output_dir):
+        """Test that jobs=1 still builds every platform, in order."""
+        platforms = ["linux-amd64", "windows-amd64", "darwin-arm64"]
         wheels = build_wheels(
-            str(GO_EXAMPLE_DIR),
+            GO_EXAMPLE_DIR_STR,
             name="go-example",
             version="1.0.0",
             output_dir=str(output_dir),
             platforms=platforms,
+            jobs=1,
         )
 
-        assert len(wheels) == 4
-        assert all(Path(w).exists() for w in wheels)
+        assert [Path(w).name.rsplit("-", 1)[-1] for w in wheels] == [
+            "manylinux_2_17_x86_64.whl",
+            "win_amd64.whl",
+            "macosx_11_0_arm64.whl",
+        ]
 
-    def test_wheel_filename_format(self, tmp_path):
+    @pytest.mark.usefixtures("stub_go_build")
+    def test_wheel_filename_format(self, output_dir):
         """Test that wheel filenames follow PEP 427 format."""
-        output_dir = tmp_path / "dist"
-        output_dir.mkdir()
-
-        current_platform = get_current_platform()
-        expected_tag = get_wheel_platform_tag(current_platform)
-
         wheels = build_wheels(
-            str(GO_EXAMPLE_DIR),
+            GO_EXAMPLE_DIR_STR,
             name="my-test-tool",
             version="2.3.4",
             output_dir=str(output_dir),
-            platforms=[current_platform],
+            platforms=[CURRENT_PLATFORM],
         )
 
         wheel_path = Path(wheels[0])
         # Wheel filename: {distribution}-{version}-{python}-{abi}-{platform}.whl
-        expected_name = f"my_test_tool-2.3.4-py3-none-{expected_tag}.whl"
+        expected_name = f"my_test_tool-2.3.4-py3-none-{CURRENT_WHEEL_TAG}.whl"
         assert wheel_path.name == expected_name
 
-    def test_wheel_contains_required_files(self, tmp_path):
-        """Test that the wheel contains all required files."""
-        output_dir = tmp_path / "dist"
-        output_dir.mkdir()
-
-        current_platform = get_current_platform()
-        wheels = build_wheels(
-            str(GO_EXAMPLE_DIR),
-            name="go-example",
-            version="1.0.0",
-            output_dir=str(output_dir),
-            platforms=[current_platform],
-        )
-
-        with zipfile.ZipFile(wheels[0], "r") as whl:
-            names = whl.namelist()
-
-            # Check package files
-            assert "go_example/__init__.py" in names
-            assert "go_example/__main__.py" in names
-
-            # Check binary exists (with or without .exe)
-            binary_files = [n for n in names if n.startswith("go_example/bin/")]
-            assert len(binary_files) == 1
+    def test_wheel_structure(self, default_wheel, default_wheel_bytes):
+        """Test the files, metadata, entry points and name of the default wheel."""
+        # go-example directory should produce go_example package
+        assert Path(default_wheel).name.startswith("go_example-1.0.0-")
 
-            # Check dist-info files
-            assert any("METADATA" in n for n in names)
-            assert any("WHEEL" in n for n in names)
-            assert any("RECORD" in n for n in names)
-            assert any("entry_points.txt" in n for n in names)
+        with zipfile.ZipFile(io.BytesIO(default_wheel_bytes)) as whl:
+            names = set(whl.namelist())
+            metadata = read_dist_info(whl, "go-example", "1.0.0", "METADATA")
+            entry_points = read_dist_info(
+                whl, "go-example", "1.0.0", "entry_points.txt"
+            )
 
-    def test_wheel_metadata_content(self, tmp_path):
-        """Test that METADATA file contains correct content."""
-        output_dir = tmp_path / "dist"
-        output_dir.mkdir()
+        # Check package files
+        assert "go_example/__init__.py" in names
+        assert "go_example/__main__.py" in names
 
-        current_platform = get_current_platform()
-        wheels = build_wheels(
-            str(GO_EXAMPLE_DIR),
-            name="my-package",
-            version="1.2.3",
-            output_dir=str(output_dir),
-            platforms=[current_platform],
-        )
+        # Check binary exists (with or without .exe)
+        binary_files = [n for n in names if n.startswith("go_example/bin/")]
+        assert len(binary_files) == 1
 
-        with zipfile.ZipFile(wheels[0], "r") as whl:
-            metadata_file = [n for n in whl.namelist() if n.endswith("METADATA")][0]
-            metadata = whl.read(metadata_file).decode("utf-8")
+        # Check dist-info files
+        suffixes = {n.rsplit("/", 1)[-1] for n in names}
+        assert {"METADATA", "WHEEL", "RECORD", "entry_points.txt"} <= suffixes
 
-            assert "Name: my-package" in metadata
-            assert "Version: 1.2.3" in metadata
-            assert "Requires-Python: >=3.10" in metadata
+        assert b"Name: go-example" in metadata
+        assert b"Version: 1.0.0" in metadata
+        assert b"Requires-Python: >=3.10" in metadata
 
-    def test_wheel_entry_points(self, tmp_path):
-        """Test that entry_points.txt contains correct content."""
-        output_dir = tmp_path / "dist"
-        output_dir.mkdir()
+        assert b"[console_scripts]" in entry_points
+        assert b"go-example = go_example:main" in entry_points
 
-        current_platform = get_current_platform()
+    @pytest.mark.usefixtures("stub_go_build")
+    def test_custom_name_and_entry_point(self, output_dir):
+        """Test METADATA and entry_points.txt for a custom name and entry point."""
         wheels = build_wheels(
-            str(GO_EXAMPLE_DIR),
+            GO_EXAMPLE_DIR_STR,
             name="my-tool",
-            version="1.0.0",
+            version="1.2.3",
             output_dir=str(output_dir),
             entry_point="mytool",
-            platforms=[current_platform],
+            platforms=[CURRENT_PLATFORM],
         )
 
         with zipfile.ZipFile(wheels[0], "r") as whl:
-            ep_file = [n for n in whl.namelist() if n.endswith("entry_points.txt")][0]
-            entry_points = whl.read(ep_file).decode("utf-8")
-
-            assert "[console_scripts]" in entry_points
-            assert "mytool = my_tool:main" in entry_points
-
-    def test_default_name_from_directory(self, tmp_path):
-        """Test that package name defaults to directory basename."""
-        output_dir = tmp_path / "dist"
-        output_dir.mkdir()
+            metadata = read_dist_info(whl, "my-tool", "1.2.3", "METADATA")
+            entry_points = read_dist_info(whl, "my-tool", "1.2.3", "entry_points.txt")
 
-        current_platform = get_current_platform()
-        wheels = build_wheels(
-            str(GO_EXAMPLE_DIR),
-            version="1.0.0",
-            output_dir=str(output_dir),
-            platforms=[current_platform],
-        )
-
-        # go-example directory should produce go_example package
-        wheel_path = Path(wheels[0])
-        assert "go_example-" in wheel_path.name or "go-example-" in wheel_path.name
+        assert b"Name: my-tool" in metadata
+        assert b"Version: 1.2.3" in metadata
+        assert b"mytool = my_tool:main" in entry_points
 
 
 class TestWheelExecution:
     """Tests for executing the built wheel."""
 
-    def test_wheel_binary_executes(self, tmp_path):
+    @pytest.mark.slow
+    def test_wheel_binary_executes(self, installed_script):
         """Test that the binary in the wheel can be executed."""
-        output_dir = tmp_path / "dist"
-        output_dir.mkdir()
-
-        current_platform = get_current_platform()
-        wheels = build_wheels(
-            str(GO_EXAMPLE_DIR),
-            name="go-example",
-            version="1.0.0",
-            output_dir=str(output_dir),
-            platforms=[current_platform],
-        )
-
-        wheel_path = wheels[0]
-
-        # Use uv run to test the wheel
         result = subprocess.run(
-            ["uv", "run", "--with", wheel_path, "go-example", "--version"],
+            [installed_script, "--version"],
             capture_output=True,
             text=True,
         )
@@ -237,24 +153,11 @@ class TestWheelExecution:
         assert result.returncode == 0
         assert "go-example 1.0.0" in result.stdout
 
-    def test_wheel_binary_with_arguments(self, tmp_path):
+    @pytest.mark.slow
+    def test_wheel_binary_with_arguments(self, installed_script):
         """Test that arguments are passed correctly to the binary."""
-        output_dir = tmp_path / "dist"
-        output_dir.mkdir()
-
-        current_platform = get_current_platform()
-        wheels = build_wheels(
-            str(GO_EXAMPLE_DIR),
-            name="go-example",
-            version="1.0.0",
-            output_dir=str(output_dir),
-            platforms=[current_platform],
-        )
-
-        wheel_path = wheels[0]
-
         result = subprocess.run(
-            ["uv", "run", "--with", wheel_path, "go-example", "--echo", "hello", "world"],
+            [installed_script, "--echo", "hello", "world"],
             capture_output=True,
             text=True,
         )
@@ -262,82 +165,27 @@ class TestWheelExecution:
         assert result.returncode == 0
         assert "hello world" in result.stdout
 
-    def test_python_m_execution(self, tmp_path):
+    @pytest.mark.slow
+    def test_python_m_execution(self, unpacked_wheel):
         """Test that python -m package_name works."""
-        output_dir = tmp_path / "dist"
-        output_dir.mkdir()
-
-        current_platform = get_current_platform()
-        wheels = build_wheels(
-            str(GO_EXAMPLE_DIR),
-            name="go-example",
-            version="1.0.0",
-            output_dir=str(output_dir),
-            platforms=[current_platform],
-        )
-
-        wheel_path = wheels[0]
-
-        # Create a temporary venv and install the wheel
-        venv_dir = tmp_path / "venv"
-        subprocess.run(["uv", "venv", str(venv_dir)], check=True)
-
-        # Get the python path
-        if sys.platform == "win32":
-            python_path = venv_dir / "Scripts" / "python.exe"
-        else:
-            python_path = venv_dir / "bin" / "python"
-
-        # Install the wheel
-        subprocess.run(
-            ["uv", "pip", "install", wheel_path, "--python", str(python_path)],
-            check=True,
-        )
-
-        # Test python -m execution
         result = subprocess.run(
-            [str(python_path), "-m", "go_example", "--version"],
+            [sys.executable, "-m", "go_example", "--version"],
             capture_output=True,
             text=True,
+            env={**os.environ, "PYTHONPATH": str(unpacked_wheel)},
         )
 
         assert result.returncode == 0
         assert "go-example 1.0.0" in result.stdout
 
-    def test_python_m_with_arguments(self, tmp_path):
+    @pytest.mark.slow
+    def test_python_m_with_arguments(self, unpacked_wheel):
         """Test that python -m passes arguments correctly."""
-        output_dir = tmp_path / "dist"
-        output_dir.mkdir()
-
-        current_platform = get_current_platform()
-        wheels = build_wheels(
-            str(GO_EXAMPLE_DIR),
-            name="go-example",
-            version="1.0.0",
-            output_dir=str(output_dir),
-            platforms=[current_platform],
-        )
-
-        wheel_path = wheels[0]
-
-        # Create a temporary venv and install the wheel
-        venv_dir = tmp_path / "venv"
-        subprocess.run(["uv", "venv", str(venv_dir)], check=True)
-
-        if sys.platform == "win32":
-            python_path = venv_dir / "Scripts" / "python.exe"
-        else:
-            python_path = venv_dir / "bin" / "python"
-
-        subprocess.run(
-            ["uv", "pip", "install", wheel_path, "--python", str(python_path)],
-            check=True,
-        )
-
         result = subprocess.run(
-            [str(python_path), "-m", "go_example", "--echo", "test", "args"],
+            [sys.executable, "-m", "go_example", "--echo", "test", "args"],
             capture_output=True,
             text=True,
+            env={**os.environ, "PYTHONPATH": str(unpacked_wheel)},
         )
 
         assert result.returncode == 0
@@ -347,11 +195,8 @@ class TestWheelExecution:
 class TestErrorHandling:
     """Tests for error handling."""
 
-    def test_invalid_go_directory(self, tmp_path):
+    def test_invalid_go_directory(self, tmp_path, output_dir):
         """Test that invalid Go directory raises error."""
-        output_dir = tmp_path / "dist"
-        output_dir.mkdir()
-
         with pytest.raises(FileNotFoundError):
             build_wheels(
                 str(tmp_path / "nonexistent"),
@@ -359,11 +204,8 @@ class TestErrorHandling:
                 output_dir=str(output_dir),
             )
 
-    def test_directory_without_go_mod(self, tmp_path):
+    def test_directory_without_go_mod(self, tmp_path, output_dir):
         """Test that directory without go.mod raises error."""
-        output_dir = tmp_path / "dist"
-        output_dir.mkdir()
-
         # Create empty directory
         go_dir = tmp_path / "empty"
         go_dir.mkdir()
@@ -375,41 +217,99 @@ class TestErrorHandling:
                 output_dir=str(output_dir),
             )
 
+    def test_unknown_platforms_reported_together(self, output_dir, capsys):
+        """Test that all unknown platforms are reported in a single warning."""
+        wheels = build_wheels(
+            GO_EXAMPLE_DIR_STR,
+            name="go-example",
+            version="1.0.0",
+            output_dir=str(output_dir),
+            platforms=["plan9-amd64", CURRENT_PLATFORM, "beos-x86"],
+        )
+
+        assert len(wheels) == 1
+        warnings = [
+            line for line in capsys.readouterr().out.splitlines() if "Warning" in line
+        ]
+        assert warnings == ["Warning: Unknown platform(s) plan9-amd64, beos-x86, skipping"]
+
+    def test_entry_point_needing_csv_quoting(self, output_dir, monkeypatch):
+        """Test that an entry point RECORD cannot hold is rejected before compiling."""
+
+        def fail_build_binary(*args, **kwargs):
+            raise AssertionError("go build should not run")
+
+        monkeypatch.setattr("go_to_wheel._build_binary", fail_build_binary)
+        with pytest.raises(ValueError, match="entry point"):
+            build_wheels(
+                GO_EXAMPLE_DIR_STR,
+                version="1.0.0",
+                output_dir=str(output_dir),
+                entry_point="a,b",
+                platforms=[CURRENT_PLATFORM],
+            )
+
+    def test_failed_wheel_is_removed(self, tmp_path, output_dir):
+        """Test that a wheel that fails part way through is not left behind."""
+        binary_path = tmp_path / "go-example"
+        binary_path.write_bytes(b"\x7fELF")
+        with pytest.raises(ValueError, match="Unsupported character"):
+            build_wheel(
+                str(binary_path),
+                str(output_dir),
+                name="go-example",
+                version="1.0.0",
+                platform_tag=CURRENT_WHEEL_TAG,
+                entry_point="a,b",
+            )
+        assert list(output_dir.iterdir()) == []
+
+    def test_unwritable_output_dir(self, tmp_path):
+        """Test that failing to create the wheel reports the original error."""
+        binary_path = tmp_path / "go-example"
+        binary_path.write_bytes(b"\x7fELF")
+        missing_dir = tmp_path / "missing"
+        with pytest.raises(FileNotFoundError) as excinfo:
+            build_wheel(
+                str(binary_path),
+                str(missing_dir),
+                name="go-example",
+                version="1.0.0",
+                platform_tag=CURRENT_WHEEL_TAG,
+                entry_point="go-example",
+            )
+        # Not a second error raised while cleaning up the wheel
+        assert excinfo.value.__context__ is None
+        assert excinfo.value.filename.startswith(str(missing_dir))
+
 
 class TestPackageNaming:
     """Tests for package naming conventions."""
 
-    def test_hyphen_to_underscore_in_import_name(self, tmp_path):
+    @pytest.mark.usefixtures("stub_go_build")
+    def test_hyphen_to_underscore_in_import_name(self, output_dir):
         """Test that hyphens are converted to underscores in import name."""
-        output_dir = tmp_path / "dist"
-        output_dir.mkdir()
-
-        current_platform = get_current_platform()
         wheels = build_wheels(
-            str(GO_EXAMPLE_DIR),
+            GO_EXAMPLE_DIR_STR,
             name="my-cool-tool",
             version="1.0.0",
             output_dir=str(output_dir),
-            platforms=[current_platform],
+            platforms=[CURRENT_PLATFORM],
         )
 
         with zipfile.ZipFile(wheels[0], "r") as whl:
-            names = whl.namelist()
             # Import name should use underscores
-            assert any("my_cool_tool/__init__.py" in n for n in names)
+            assert "my_cool_tool/__init__.py" in set(whl.namelist())
 
-    def test_wheel_filename_uses_underscores(self, tmp_path):
+    @pytest.mark.usefixtures("stub_go_build")
+    def test_wheel_filename_uses_underscores(self, output_dir):
         """Test that wheel filename uses underscores per PEP 427."""
-        output_dir = tmp_path / "dist"
-        output_dir.mkdir()
-
-        current_platform = get_current_platform()
         wheels = build_wheels(
-            str(GO_EXAMPLE_DIR),
+            GO_EXAMPLE_DIR_STR,
             name="my-cool-tool",
             version="1.0.0",
             output_dir=str(output_dir),
-            platforms=[current_platform],
+            platforms=[CURRENT_PLATFORM],
         )
 
         wheel_path = Path(wheels[0])
@@ -420,90 +320,65 @@ class TestPackageNaming:
 class TestReadmeOption:
     """Tests for the --readme option."""
 
-    def test_readme_in_metadata(self, tmp_path):
+    @pytest.mark.usefixtures("stub_go_build")
+    def test_readme_in_metadata(self, tmp_path, output_dir):
         """Test that README content appears in METADATA as long description."""
-        output_dir = tmp_path / "dist"
-        output_dir.mkdir()
-
         # Create a README file
         readme_path = tmp_path / "README.md"
         readme_content = "# My Tool\n\nThis is a great tool.\n\n## Features\n\n- Fast\n- Simple"
         readme_path.write_text(readme_content)
 
-        current_platform = get_current_platform()
         wheels = build_wheels(
-            str(GO_EXAMPLE_DIR),
+            GO_EXAMPLE_DIR_STR,
             name="my-tool",
             version="1.0.0",
             output_dir=str(output_dir),
-            platforms=[current_platform],
+            platforms=[CURRENT_PLATFORM],
             readme=str(readme_path),
         )
 
         with zipfile.ZipFile(wheels[0], "r") as whl:
-            metadata_file = [n for n in whl.namelist() if n.endswith("METADATA")][0]
-            metadata = whl.read(metadata_file).decode("utf-8")
+            metadata = read_dist_info(whl, "my-tool", "1.0.0", "METADATA")
 
             # Should have content type header
-            assert "Description-Content-Type: text/markdown" in metadata
+            assert b"Description-Content-Type: text/markdown" in metadata
             # Should have the README content as the body
-            assert "# My Tool" in metadata
-            assert "This is a great tool." in metadata
-            assert "## Features" in metadata
+            assert b"# My Tool" in metadata
+            assert b"This is a great tool." in metadata
+            assert b"## Features" in metadata
 
-    def test_readme_file_not_found(self, tmp_path):
+    def test_readme_file_not_found(self, tmp_path, output_dir):
         """Test that non-existent README file raises error."""
-        output_dir = tmp_path / "dist"
-        output_dir.mkdir()
-
-        current_platform = get_current_platform()
         with pytest.raises(FileNotFoundError, match="README"):
             build_wheels(
-                str(GO_EXAMPLE_DIR),
+                GO_EXAMPLE_DIR_STR,
                 name="my-tool",
                 version="1.0.0",
                 output_dir=str(output_dir),
-                platforms=[current_platform],
+                platforms=[CURRENT_PLATFORM],
                 readme=str(tmp_path / "nonexistent.md"),
             )
 
-    def test_metadata_without_readme(self, tmp_path):
+    def test_metadata_without_readme(self, default_wheel_bytes):
         """Test that METADATA without README has no long description."""
-        output_dir = tmp_path / "dist"
-        output_dir.mkdir()
-
-        current_platform = get_current_platform()
-        wheels = build_wheels(
-            str(GO_EXAMPLE_DIR),
-            name="my-tool",
-            version="1.0.0",
-            output_dir=str(output_dir),
-            platforms=[current_platform],
-        )
-
-        with zipfile.ZipFile(wheels[0], "r") as whl:
-            metadata_file = [n for n in whl.namelist() if n.endswith("METADATA")][0]
-            metadata = whl.read(metadata_file).decode("utf-8")
+        with zipfile.ZipFile(io.BytesIO(default_wheel_bytes)) as whl:
+            metadata = read_dist_info(whl, "go-example", "1.0.0", "METADATA")
 
             # Should not have content type header when no README
-            assert "Description-Content-Type:" not in metadata
+            assert b"Description-Content-Type:" not in metadata
 
 
 class TestLdflags:
     """Tests for --ldflags support."""
 
-    def test_ldflags_passed_to_go_build(self, tmp_path):
+    def test_ldflags_passed_to_go_build(self, output_dir):
         """Test that custom ldflags are appended to the default -s -w flags."""
-        output_dir = tmp_path / "dist"
-        output_dir.mkdir()
-
-        current_platform = get_current_platform()
         wheels = build_wheels(
-            str(GO_EXAMPLE_VERSION_DIR),
+            GO_EXAMPLE_VERSION_DIR_STR,
             name="go-example-version",
             version="3.2.1",
             output_dir=str(output_dir),
-            platforms=[current_platform],
+            platforms=[CURRENT_PLATFORM],
             ldflags="-X main.version=3.2.1",
         )
 
@@ -519,18 +394,14 @@ class TestLdflags:
         assert result.returncode == 0
         assert "3.2.1" in result.stdout
 
-    def test_ldflags_without_version_injection(self, tmp_path):
+    def test_ldflags_without_version_injection(self, output_dir):
         """Test that without ldflags, the binary has the default 'dev' version."""
-        output_dir = tmp_path / "dist"
-        output_dir.mkdir()
-
-        current_platform = get_current_platform()
         wheels = build_wheels(
-            str(GO_EXAMPLE_VERSION_DIR),
+            GO_EXAMPLE_VERSION_DIR_STR,
             name="go-example-version",
             version="1.0.0",
             output_dir=str(output_dir),
-            platforms=[current_platform],
+            platforms=[CURRENT_PLATFORM],
         )
 
         wheel_path = wheels[0]
@@ -542,18 +413,14 @@ class TestLdflags:
         assert result.returncode == 0
         assert "dev" in result.stdout
 
-    def test_ldflags_multiple_x_flags(self, tmp_path):
+    def test_ldflags_multiple_x_flags(self, output_dir):
         """Test that multiple -X flags can be passed via ldflags."""
-        output_dir = tmp_path / "dist"
-        output_dir.mkdir()
-
-        current_platform = get_current_platform()
         wheels = build_wheels(
-            str(GO_EXAMPLE_VERSION_DIR),
+            GO_EXAMPLE_VERSION_DIR_STR,
             name="go-example-version",
             version="5.0.0",
             output_dir=str(output_dir),
-            platforms=[current_platform],
+            platforms=[CURRENT_PLATFORM],
             ldflags="-X main.version=5.0.0",
         )
 
@@ -570,18 +437,14 @@ class TestLdflags:
 class TestSetVersionVar:
     """Tests for --set-version-var support."""
 
-    def test_set_version_var_injects_version(self, tmp_path):
+    def test_set_version_var_injects_version(self, output_dir):
         """Test that --set-version-var auto-fills from --version."""
-        output_dir = tmp_path / "dist"
-        output_dir.mkdir()
-
-        current_platform = get_current_platform()
         wheels = build_wheels(
-            str(GO_EXAMPLE_VERSION_DIR),
+            GO_EXAMPLE_VERSION_DIR_STR,
             name="go-example-version",
             version="7.8.9",
             output_dir=str(output_dir),
-            platforms=[current_platform],
+            platforms=[CURRENT_PLATFORM],
             set_version_var="main.version",
         )
 
@@ -597,19 +460,15 @@ class TestSetVersionVar:
         assert result.returncode == 0
         assert "7.8.9" in result.stdout
 
-    def test_set_version_var_combined_with_ldflags(self, tmp_path):
+    def test_set_version_var_combined_with_ldflags(self, output_dir):
         """Test that --set-version-var and --ldflags can be used together."""
-        output_dir = tmp_path / "dist"
-        output_dir.mkdir()
-
-        current_platform = get_current_platform()
         # --set-version-var sets main.version, --ldflags adds extra flags
         wheels = build_wheels(
-            str(GO_EXAMPLE_VERSION_DIR),
+            GO_EXAMPLE_VERSION_DIR_STR,
             name="go-example-version",
             version="2.0.0",
             output_dir=str(output_dir),
-            platforms=[current_platform],
+            platforms=[CURRENT_PLATFORM],
             set_version_var="main.version",
             ldflags="-X main.version=override",
         )
@@ -628,20 +487,16 @@ class TestSetVersionVar:
 class TestLdflagsCLI:
     """Tests for --ldflags and --set-version-var CLI argument parsing."""
 
-    def test_cli_ldflags_argument(self, tmp_path):
+    def test_cli_ldflags_argument(self, output_dir):
         """Test that --ldflags is accepted as a CLI argument."""
-        output_dir = tmp_path / "dist"
-        output_dir.mkdir()
-
-        current_platform = get_current_platform()
         result = subprocess.run(
             [
                 "go-to-wheel",
-                str(GO_EXAMPLE_VERSION_DIR),
+                GO_EXAMPLE_VERSION_DIR_STR,
                 "--name", "go-example-version",
                 "--version", "1.0.0",
                 "--output-dir", str(output_dir),
-                "--platforms", current_platform,
+                "--platforms", CURRENT_PLATFORM,
                 "--ldflags", "-X main.version=1.0.0",
             ],
             capture_output=True,
@@ -650,20 +505,16 @@ class TestLdflagsCLI:
         assert result.returncode == 0
         assert "Built 1 wheel" in result.stdout
 
-    def test_cli_set_version_var_argument(self, tmp_path):
+    def test_cli_set_version_var_argument(self, output_dir):
         """Test that --set-version-var is accepted as a CLI argument."""
-        output_dir = tmp_path / "dist"
-        output_dir.mkdir()
-
-        current_platform = get_current_platform()
         result = subprocess.run(
             [
                 "go-to-wheel",
-                str(GO_EXAMPLE_VERSION_DIR),
+                GO_EXAMPLE_VERSION_DIR_STR,
                 "--name", "go-example-version",
                 "--version", "4.5.6",
                 "--output-dir", str(output_dir),
-                "--platforms", current_platform,
+                "--platforms", CURRENT_PLATFORM,
                 "--set-version-var", "main.version",
             ],
             capture_output=True,
@@ -671,3 +522,284 @@ class TestLdflagsCLI:
         )
         assert result.returncode == 0
         assert "Built 1 wheel" in result.stdout
+
+
+class TestHashAlgorithm:
+    """Tests for the hash_algorithm option."""
+
+    def test_blake2b_record_hashes(self, output_dir):
+        """Test that RECORD entries use blake2b when requested."""
+        wheels = build_wheels(
+            GO_EXAMPLE_DIR_STR,
+            name="go-example",
+            version="1.0.0",
+            output_dir=str(output_dir),
+            platforms=[CURRENT_PLATFORM],
+            hash_algorithm="blake2b",
+        )
+
+        with zipfile.ZipFile(wheels[0], "r") as whl:
+            record_file = "go_example-1.0.0.dist-info/RECORD"
+            rows = whl.read(record_file).decode("utf-8").splitlines()
+
+            for row in rows:
+                path, hash_val, size = row.split(",")
+                if path == record_file:
+                    assert hash_val == ""
+                    continue
+                digest = hashlib.blake2b(whl.read(path), digest_size=32).digest()
+                encoded = base64.urlsafe_b64encode(digest).rstrip(b"=").decode("ascii")
+                assert hash_val == f"blake2b={encoded}"
+                assert int(size) == len(whl.read(path))
+
+    def test_unsupported_hash_algorithm(self, output_dir):
+        """Test that an unknown hash algorithm raises error."""
+        with pytest.raises(ValueError, match="hash algorithm"):
+            build_wheels(
+                GO_EXAMPLE_DIR_STR,
+                name="go-example",
+                output_dir=str(output_dir),
+                hash_algorithm="md5",
+            )
+
+
+class TestCompression:
+    """Tests for the compression option."""
+
+    def test_default_compression(self, default_wheel_bytes):
+        """Test that the binary is stored and text files are deflated."""
+        with zipfile.ZipFile(io.BytesIO(default_wheel_bytes)) as whl:
+            for info in whl.infolist():
+                if info.filename.startswith("go_example/bin/"):
+                    assert info.compress_type == zipfile.ZIP_STORED
+                else:
+                    assert info.compress_type == zipfile.ZIP_DEFLATED
+
+    def test_store_compression(self, output_dir):
+        """Test that compression="store" writes every member uncompressed."""
+        wheels = build_wheels(
+            GO_EXAMPLE_DIR_STR,
+            name="go-example",
+            version="1.0.0",
+            output_dir=str(output_dir),
+            platforms=[CURRENT_PLATFORM],
+            compression="store",
+        )
+
+        with zipfile.ZipFile(wheels[0], "r") as whl:
+            assert all(
+                info.compress_type == zipfile.ZIP_STORED for info in whl.infolist()
+            )
+
+
+class TestZip64:
+    """Tests for Zip64 handling of the streamed binary."""
+
+    def test_binary_over_zip64_limit(self, tmp_path, output_dir, monkeypatch):
+        """Test that a binary too large for plain zip headers is written."""
+        binary_path = tmp_path / "go-example"
+        binary_path.write_bytes(b"\x7fELF" + bytes(4096))
+        # Shrink the limit rather than writing a 2 GiB binary
+        monkeypatch.setattr(zipfile, "ZIP64_LIMIT", 1024)
+
+        wheel_path = build_wheel(
+            str(binary_path),
+            str(output_dir),
+            name="go-example",
+            version="1.0.0",
+            platform_tag=CURRENT_WHEEL_TAG,
+            entry_point="go-example",
+        )
+
+        with zipfile.ZipFile(wheel_path, "r") as whl:
+            assert whl.testzip() is None
+            binary = whl.read("go_example/bin/go-example")
+        assert binary == binary_path.read_bytes()
+
+    def test_small_binary_has_no_zip64_extra(self, default_wheel_bytes):
+        """Test that a normal sized binary gets no Zip64 extra field."""
+        with zipfile.ZipFile(io.BytesIO(default_wheel_bytes)) as whl:
+            info = whl.getinfo("go_example/bin/go-example")
+
+        header_ids = []
+        extra = info.extra
+        while len(extra) >= 4:
+            header_id, size = struct.unpack("<HH", extra[:4])
+            header_ids.append(header_id)
+            extra = extra[4 + size :]
+        assert 0x0001 not in header_ids
+
+
+class TestWorkDir:
+    """Tests for the work_dir option."""
+
+    def test_work_dir_is_kept_between_builds(self, tmp_path, output_dir, monkeypatch):
+        """Test that work_dir keeps binaries and the Go build cache."""
+        # go build has to actually run to populate the Go build cache
+        monkeypatch.delenv(BINARY_CACHE_ENV)
+        work_dir = tmp_path / "work"
+
+        for version in ("1.0.0", "1.0.1"):
+            wheels = build_wheels(
+                GO_EXAMPLE_DIR_STR,
+                name="go-example",
+                version=version,
+                output_dir=str(output_dir),
+                platforms=[CURRENT_PLATFORM],
+                work_dir=str(work_dir),
+            )
+            assert len(wheels) == 1
+
+        assert (work_dir / CURRENT_PLATFORM).is_dir()
+        assert any((work_dir / "go-cache").iterdir())
+
+
+class TestBinaryCache:
+    """Tests for the binary_cache option."""
+
+    def test_binary_cache_reused(self, tmp_path, output_dir):
+        """Test that a cached binary is used instead of recompiling."""
+        cache_dir = tmp_path / "cache"
+
+        build_kwargs = {
+            "name": "go-example",
+            "version": "1.0.0",
+            "output_dir": str(output_dir),
+            "platforms": ["linux-amd64"],
+            "binary_cache": str(cache_dir),
+        }
+        build_wheels(GO_EXAMPLE_DIR_STR, **build_kwargs)
+
+        # Replace the cached binary so we can tell whether it was reused
+        (cached,) = cache_dir.iterdir()
+        cached.write_bytes(b"cached binary")
+
+        wheels = build_wheels(GO_EXAMPLE_DIR_STR, **build_kwargs)
+        with zipfile.ZipFile(wheels[0], "r") as whl:
+            assert whl.read("go_example/bin/go-example") == b"cached binary"
+
+        # Different ldflags produce a different binary, so must not hit the cache
+        build_wheels(GO_EXAMPLE_DIR_STR, ldflags="-X main.x=y", **build_kwargs)
+        assert len(list(cache_dir.iterdir())) == 2
+
+    def test_binary_cache_hit_with_output_inside_module(self, tmp_path):
+        """Test that wheels written inside the module do not change the cache key."""
+        go_dir = tmp_path / "go-example"
+        shutil.copytree(GO_EXAMPLE_DIR_STR, go_dir)
+        cache_dir = tmp_path / "cache"
+
+        build_kwargs = {
+            "version": "1.0.0",
+            "output_dir": str(go_dir / "dist"),
+            "platforms": ["linux-amd64"],
+            "binary_cache": str(cache_dir),
+        }
+        build_wheels(str(go_dir), **build_kwargs)
+
+        (cached,) = cache_dir.iterdir()
+        cached.write_bytes(b"cached binary")
+
+        wheels = build_wheels(str(go_dir), **build_kwargs)
+        with zipfile.ZipFile(wheels[0], "r") as whl:
+            assert whl.read("go_example/bin/go-example") == b"cached binary"
+
+    def test_binary_cache_key_includes_go_env(self, monkeypatch):
+        """Test that Go settings which change code generation change the key."""
+        monkeypatch.delenv("GOAMD64", raising=False)
+        default_key = binary_cache_prefix(GO_EXAMPLE_DIR_STR)
+        monkeypatch.setenv("GOAMD64", "v3")
+        assert binary_cache_prefix(GO_EXAMPLE_DIR_STR) != default_key
+
+
+class TestGoCache:
+    """Tests for the go_cache option."""
+
+    def test_relative_go_cache_is_populated(self, tmp_path, output_dir, monkeypatch):
+        """Test that a relative go_cache is resolved and used by go build."""
+        # go build has to actually run to populate the Go build cache
+        monkeypatch.delenv(BINARY_CACHE_ENV)
+        monkeypatch.chdir(tmp_path)
+
+        build_wheels(
+            GO_EXAMPLE_DIR_STR,
+            name="go-example",
+            version="1.0.0",
+            output_dir=str(output_dir),
+            platforms=[CURRENT_PLATFORM],
+            go_cache="go-cache",
+        )
+
+        assert any((tmp_path / "go-cache").iterdir())
+
+
+class TestBuildOptionsCLI:
+    """Tests for parsing the build option CLI arguments."""
+
+    def run_cli(self, output_dir, *args, cwd=None):
+        return subprocess.run(
+            [
+                "go-to-wheel",
+                GO_EXAMPLE_DIR_STR,
+                "--name", "go-example",
+                "--version", "1.0.0",
+                "--output-dir", str(output_dir),
+                "--platforms", CURRENT_PLATFORM,
+                *args,
+            ],
+            capture_output=True,
+            text=True,
+            cwd=cwd,
+        )
+
+    def test_cli_go_cache_argument(self, tmp_path, output_dir):
+        """Test that --go-cache is accepted and resolved against the cwd."""
+        result = self.run_cli(output_dir, "--go-cache", "go-cache", cwd=tmp_path)
+        assert result.returncode == 0
+        assert "Built 1 wheel" in result.stdout
+        assert (tmp_path / "go-cache").is_dir()
+
+    def test_cli_work_dir_argument(self, tmp_path, output_dir):
+        """Test that --work-dir is accepted and holds the Go build cache."""
+        work_dir = tmp_path / "work"
+        result = self.run_cli(output_dir, "--work-dir", str(work_dir))
+        assert result.returncode == 0
+        assert (work_dir / "go-cache").is_dir()
+
+    def test_cli_binary_cache_argument(self, tmp_path, output_dir):
+        """Test that --binary-cache is accepted and stores the binary."""
+        cache_dir = tmp_path / "cache"
+        result = self.run_cli(output_dir, "--binary-cache", str(cache_dir))
+        assert result.returncode == 0
+        assert len(list(cache_dir.iterdir())) == 1
+
+    def test_cli_jobs_argument(self, output_dir):
+        """Test that --jobs is accepted and validated."""
+        result = self.run_cli(output_dir, "--jobs", "1")
+        assert result.returncode == 0
+        assert "Built 1 wheel" in result.stdout
+
+        result = self.run_cli(output_dir, "--jobs", "0")
+        assert result.returncode == 1
+        assert "jobs must be at least 1" in result.stderr
+
+    def test_cli_compression_argument(self, output_dir):
+        """Test that --compression store writes every member uncompressed."""
+        result = self.run_cli(output_dir, "--compression", "store")
+        assert result.returncode == 0
+
+        (wheel_path,) = output_dir.iterdir()
+        with zipfile.ZipFile(wheel_path, "r") as whl:
+            assert all(
+                info.compress_type == zipfile.ZIP_STORED for info in whl.infolist()
+            )
+
+    def test_cli_hash_algorithm_argument(self, output_dir):
+        """Test that --hash-algorithm blake2b is used for RECORD entries."""
+        result = self.run_cli(output_dir, "--hash-algorithm", "blake2b")
+        assert result.returncode == 0
+
+        (wheel_path,) = output_dir.iterdir()
+        with zipfile.ZipFile(wheel_path, "r") as whl:
+            record = read_dist_info(whl, "go-example", "1.0.0", "RECORD")
+        assert b",blake2b=" in record
+        assert b",sha256=" not in record